@@ -18,47 +18,168 @@ Examples:
   python arxiv_watcher.py --since 2025-01-01 --out ~/Papers/arxiv_hits --dry
 """
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
 import csv
+import functools
 import datetime as dt
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 import re
 import subprocess
 import urllib.request
 import urllib.error
-import xml.etree.ElementTree as ET
 from urllib.parse import urlencode
 import sys
 import shutil
 import getpass
+import gzip
+import zlib
 import os
+import plistlib
 import textwrap
 import json
+import operator
+import threading
 import time
 import html as html_lib
+import io
+
+try:  # the parser behind re.compile, to check pattern rewrites (see _boundary_probe)
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse as _sre_parse
+
+try:  # optional: libxml2-backed parsing, same ElementTree API (pip install lxml)
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+try:  # optional: keep-alive connection pooling (pip install requests)
+    import requests
+except ImportError:
+    requests = None
+
+try:  # optional: C JSON codec for the state file (pip install orjson)
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # optional: scan all patterns in one DFA pass (pip install hyperscan)
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 ARXIV_API = "http://export.arxiv.org/api/query"
+OAI_URL = "https://oaipmh.arxiv.org/oai"  # OAI-PMH endpoint for bulk harvesting (--oai)
 
 # arXiv asks for a descriptive User-Agent and a few seconds between requests.
 # https://info.arxiv.org/help/api/tou.html
 USER_AGENT = "arxiv-watcher/1.1 (+https://github.com/yourname/arxiv-watcher)"
-REQUEST_PAUSE_S = 3.0  # polite delay between paged requests
+REQUEST_PAUSE_S = 3.0  # minimum gap between API requests
+PDF_WORKERS = 4        # concurrent PDF downloads; kept low to stay polite to arxiv.org
+
+# One pooled session for API pages and PDFs, so consecutive requests to arXiv
+# reuse the TCP/TLS connection instead of handshaking every time.
+_SESSION = None
+if requests is not None:
+    _SESSION = requests.Session()
+    _SESSION.headers["User-Agent"] = USER_AGENT
 
 STATE_PATH = Path.home() / ".local" / "share" / "arxiv_watcher" / "state.json"
+# Dedupe history: one arXiv ID per line, oldest first, gzip-compressed. Runs
+# append a new gzip member holding just their new IDs; readers see one stream.
+SEEN_IDS_PATH = STATE_PATH.with_name("seen_ids.txt.gz")
+SEEN_IDS_MAX = 50000  # newest IDs kept whenever the file is compacted
 
 def _load_state():
     p = STATE_PATH
     if not p.exists():
-        return {"last_success_iso": None, "seen_ids": []}
+        return {"last_success_iso": None}
     try:
+        if orjson is not None:
+            return orjson.loads(p.read_bytes())
         return json.loads(p.read_text(encoding="utf-8"))
     except Exception:
-        return {"last_success_iso": None, "seen_ids": []}
+        return {"last_success_iso": None}
 
 def _save_state(state):
     p = STATE_PATH
     p.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        p.write_bytes(orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+        return
     p.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
 
+def _read_seen_log(p):
+    """Return (ids, damaged) for the gzip log at `p`, decoded member by member,
+    or (None, False) if the file exists but can't be read. A run killed
+    mid-append leaves a truncated last member; everything before it, and the
+    complete lines inside it, are kept rather than the whole log being lost."""
+    try:
+        data = p.read_bytes()
+    except FileNotFoundError:
+        return [], False
+    except OSError as ex:
+        print(f"⚠️ Could not read {p}: {ex}", file=sys.stderr)
+        return None, False
+    chunks = []
+    damaged = False
+    while data:
+        d = zlib.decompressobj(wbits=31)  # one gzip member
+        try:
+            chunk = d.decompress(data)
+        except zlib.error:
+            damaged = True
+            break
+        if not d.eof:  # member cut short: keep its complete lines only
+            chunks.append(chunk[:chunk.rfind(b"\n") + 1])
+            damaged = True
+            break
+        chunks.append(chunk)
+        data = d.unused_data
+    return b"".join(chunks).decode("utf-8", "replace").split(), damaged
+
+def _load_seen_ids(state):
+    """Return (ids, rewrite): the seen arXiv IDs, oldest first, merging in the
+    ``seen_ids`` list that state.json used to hold, and whether the log must be
+    rewritten on next save (to fold that list in, or to replace a damaged file).
+    rewrite is None when the log couldn't be read: its contents are unknown, so
+    it must only be appended to."""
+    ids, damaged = _read_seen_log(SEEN_IDS_PATH)
+    if ids is None:
+        print(f"⚠️ Deduplicating against state.json only this run; {SEEN_IDS_PATH} "
+              "will only be appended to.", file=sys.stderr)
+        return list(state.get("seen_ids", [])), None
+    if damaged:
+        print(f"⚠️ {SEEN_IDS_PATH} is damaged; kept the {len(ids)} IDs before the "
+              "damage, and it will be rewritten.", file=sys.stderr)
+    have = set(ids)
+    older = []
+    for i in state.get("seen_ids", []):
+        if i not in have:
+            have.add(i)
+            older.append(i)
+    return (older + ids if older else ids), damaged or "seen_ids" in state
+
+def _save_seen_ids(ids, new_ids, rewrite=False):
+    """Append just `new_ids` to the seen-IDs log. The file is only rewritten
+    (keeping the newest SEEN_IDS_MAX) once it has grown to twice that, or when
+    `rewrite` is set (see _load_seen_ids). A rewrite goes to a temp file that
+    replaces the log only once complete. With rewrite=None (log unreadable)
+    the new IDs are only ever appended."""
+    p = SEEN_IDS_PATH
+    p.parent.mkdir(parents=True, exist_ok=True)
+    if rewrite is not None and (rewrite or len(ids) + len(new_ids) > 2 * SEEN_IDS_MAX):
+        keep = (list(ids) + list(new_ids))[-SEEN_IDS_MAX:]
+        tmp = p.with_name(p.name + ".tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            f.writelines(i + "\n" for i in keep)
+        os.replace(tmp, p)
+    elif new_ids:
+        with gzip.open(p, "at", encoding="utf-8") as f:
+            f.writelines(i + "\n" for i in new_ids)
+
 def _now_utc():
     return dt.datetime.now(dt.timezone.utc)
 
@@ -66,7 +187,11 @@ def _parse_iso(s):
     if not s:
         return None
     try:
-        return dt.datetime.fromisoformat(s.replace("Z", "+00:00"))
+        # arXiv stamps always end in "Z", which fromisoformat only accepts
+        # from Python 3.11; swap just that last character, no full scan.
+        if s[-1] == "Z":
+            s = s[:-1] + "+00:00"
+        return dt.datetime.fromisoformat(s)
     except Exception:
         return None
 
@@ -89,51 +214,6 @@ def wrap_line(s, width):
         return s
     return "\n     ".join(textwrap.wrap(s, width=width))
 
-PLIST_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN"
-   "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-  <key>Label</key>
-  <string>__LABEL__</string>
-
-  <key>StartCalendarInterval</key>
-  <dict>
-    <key>Hour</key>
-    <integer>__HOUR__</integer>
-    <key>Minute</key>
-    <integer>__MINUTE__</integer>
-  </dict>
-
-__START_INTERVAL_BLOCK__
-
-  <key>ProgramArguments</key>
-  <array>
-    <string>__PYTHON__</string>
-    <string>__SCRIPT__</string>
-    <string>--every-hours</string>
-    <string>__EVERY_HOURS__</string>
-    <string>--out</string>
-    <string>__OUT_DIR__</string>
-__NOTIFY_ARG__
-  </array>
-
-  <key>StandardOutPath</key>
-  <string>__LOG_DIR__/arxiv_watcher.out</string>
-  <key>StandardErrorPath</key>
-  <string>__LOG_DIR__/arxiv_watcher.err</string>
-
-  <!-- Run immediately at load -->
-  <key>RunAtLoad</key>
-  <true/>
-
-  <!-- Don’t respawn endlessly; only run on schedule + StartInterval -->
-  <key>KeepAlive</key>
-  <false/>
-</dict>
-</plist>
-"""
-
 def _parse_hhmm(s):
     # "09:30" -> (9, 30)
     parts = s.strip().split(":")
@@ -162,31 +242,25 @@ def build_plist(
     log_dir = str(Path(log_dir or (Path.home() / "Library" / "Logs")).expanduser().resolve())
     hour, minute = _parse_hhmm(schedule_hhmm)
 
-    notify_arg = "      <string>--notify</string>\n" if notify else ""
-
+    args = [python_path, script_path, "--every-hours", str(every_hours), "--out", out_dir]
+    if notify:
+        args.append("--notify")
+    job = {
+        "Label": label,
+        "StartCalendarInterval": {"Hour": hour, "Minute": minute},
+        "ProgramArguments": args,
+        "StandardOutPath": f"{log_dir}/arxiv_watcher.out",
+        "StandardErrorPath": f"{log_dir}/arxiv_watcher.err",
+        "RunAtLoad": True,   # run immediately at load
+        "KeepAlive": False,  # don't respawn endlessly; only run on schedule + StartInterval
+    }
     if backoff_interval and backoff_interval > 0:
-        start_interval_block = f"""  <key>StartInterval</key>
-  <integer>{int(backoff_interval)}</integer>"""
-    else:
-        start_interval_block = ""
-
-    xml = (
-        PLIST_TEMPLATE
-        .replace("__LABEL__", label)
-        .replace("__HOUR__", str(hour))
-        .replace("__MINUTE__", str(minute))
-        .replace("__PYTHON__", python_path)
-        .replace("__SCRIPT__", script_path)
-        .replace("__EVERY_HOURS__", str(every_hours))
-        .replace("__OUT_DIR__", out_dir)
-        .replace("__LOG_DIR__", log_dir)
-        .replace("__NOTIFY_ARG__", notify_arg)
-        .replace("__START_INTERVAL_BLOCK__", start_interval_block)
-    )
+        job["StartInterval"] = int(backoff_interval)
 
+    # plistlib escapes the values (an "&" in a path no longer breaks the XML).
     plist_name = f"{label}.plist"
     plist_path = Path.cwd() / plist_name
-    plist_path.write_text(xml, encoding="utf-8")
+    plist_path.write_bytes(plistlib.dumps(job, sort_keys=False))
     return str(plist_path)
 
 def install_plist(plist_path):
@@ -224,11 +298,21 @@ CORE_TERMS = [
     'all:"lepton universality"', 'all:"rare kaon"',
 ]
 DEFAULT_CATEGORIES = '(cat:hep-ex OR cat:hep-ph OR cat:hep-lat)'
+# The same categories as a set, for checking entries client-side.
+_HEP_CATS = frozenset(re.findall(r"cat:([\w.-]+)", DEFAULT_CATEGORIES))
 
 
-def build_query(extra_terms=None):
+def build_query(extra_terms=None, start=None, end=None):
+    """The API search string. With a `start` and/or `end` datetime the time
+    window is pushed to the server as a lastUpdatedDate range (minute
+    resolution, UTC), so it only returns entries the client-side checks keep."""
     terms = list(CORE_TERMS) + list(extra_terms or [])
-    return f"{DEFAULT_CATEGORIES} AND ({' OR '.join(terms)})"
+    query = f"{DEFAULT_CATEGORIES} AND ({' OR '.join(terms)})"
+    if start is not None or end is not None:
+        lo = f"{start.astimezone(dt.timezone.utc):%Y%m%d%H%M}" if start else "199101010000"
+        hi = f"{end.astimezone(dt.timezone.utc):%Y%m%d%H%M}" if end else "999912312359"
+        query += f" AND lastUpdatedDate:[{lo} TO {hi}]"
+    return query
 
 
 DEFAULT_QUERY = build_query()
@@ -306,6 +390,300 @@ if not REGEX_PATTERNS or not AUTHOR_PATTERNS:
     print("✖ No patterns loaded. Please edit patterns/keywords.txt and patterns/authors.txt")
     sys.exit(1)
 
+
+def _case_classes():
+    # Letters re.IGNORECASE treats as equal although lower() keeps them apart
+    # (i/ı, s/ſ, σ/ς, ...), from the table the re module itself uses.
+    try:
+        from re._casefix import _EXTRA_CASES  # Python 3.11+
+        return [(k, *v) for k, v in _EXTRA_CASES.items()]
+    except ImportError:
+        try:
+            from sre_compile import _equivalences
+            return list(_equivalences)
+        except ImportError:
+            return []
+
+
+_FOLD = {}
+for _cls in _case_classes():
+    for _cp in _cls:
+        # Map to one member of the class, never across word/non-word (\b).
+        _canon = min(c for c in _cls if chr(c).isalnum() == chr(_cp).isalnum())
+        if _canon != _cp:
+            _FOLD[_cp] = _canon
+
+
+def _fold(s):
+    """Lower-case `s` so that plain matching on the result agrees with
+    re.IGNORECASE on the original. Keeps the length, so match offsets index the
+    original string too: "İ" becomes "i" (lower() would append U+0307)."""
+    if s.isascii():
+        return s.lower()
+    return s.replace("\u0130", "i").lower().translate(_FOLD)
+
+
+def _lower_pattern(pat):
+    """Fold a regex like _fold, leaving the character after each backslash alone
+    (\\S, \\W, \\B mean something else in lower case)."""
+    out = []
+    i = 0
+    while i < len(pat):
+        if pat[i] == "\\":
+            out.append(pat[i:i + 2])
+            i += 2
+        else:
+            out.append(_fold(pat[i]))
+            i += 1
+    return "".join(out)
+
+
+def _folded_tree(node, fold):
+    """The parsed pattern `node` as nested tuples, with each literal's code point
+    passed through `fold`."""
+    if isinstance(node, _sre_parse.SubPattern):
+        node = node.data
+    if isinstance(node, tuple) and len(node) == 2 and isinstance(node[1], int) \
+            and node[0] in (_sre_parse.LITERAL, _sre_parse.NOT_LITERAL):
+        return node[0], fold(node[1])
+    if isinstance(node, tuple) and len(node) == 2 and node[0] is _sre_parse.RANGE:
+        return node[0], (fold(node[1][0]), fold(node[1][1]))
+    if isinstance(node, (list, tuple)):
+        return tuple(_folded_tree(x, fold) for x in node)
+    return node
+
+
+@functools.lru_cache(maxsize=None)
+def _cased_chars():
+    # Every character re.IGNORECASE may treat as another one.
+    return frozenset(c for c in range(sys.maxunicode + 1)
+                     if chr(c).lower() != chr(c) or chr(c).upper() != chr(c))
+
+
+@functools.lru_cache(maxsize=None)
+def _range_fold_is_safe(lo, hi):
+    """Whether [lo-hi] with re.IGNORECASE matches a character exactly when its
+    _fold lies in the folded range. Not true in general ([A-z] takes "_", which
+    [a-z] doesn't), so it is checked character by character."""
+    flo, fhi = ord(_fold(chr(lo))), ord(_fold(chr(hi)))
+    if flo > fhi or hi - lo > 5000 or fhi - flo > 5000:
+        return False
+    rx = re.compile(f"[{re.escape(chr(lo))}-{re.escape(chr(hi))}]", re.IGNORECASE)
+    chars = set(range(lo, hi + 1)) | set(range(flo, fhi + 1)) | _cased_chars()
+    return all(bool(rx.match(chr(c))) == (flo <= ord(_fold(chr(c))) <= fhi)
+               for c in chars)
+
+
+def _fold_is_safe(pat, lowered):
+    """Whether `lowered` (from _lower_pattern) matches folded text exactly where
+    `pat` with re.IGNORECASE matches the original. Only claimed when the parse
+    has no flags (global or scoped), only ranges _range_fold_is_safe accepts,
+    and the same literals once `pat`'s are folded, so a literal spelled as an
+    escape (\\x4B, \\N{...}) that _lower_pattern can't fold rules it out."""
+    try:
+        orig, low = _sre_parse.parse(pat), _sre_parse.parse(lowered)
+    except Exception:
+        return False
+    plain = _sre_parse.SRE_FLAG_UNICODE
+    if orig.state.flags & ~plain or low.state.flags & ~plain:
+        return False
+
+    def simple(node):
+        if isinstance(node, _sre_parse.SubPattern):
+            node = node.data
+        if isinstance(node, tuple) and node and node[0] is _sre_parse.RANGE:
+            return _range_fold_is_safe(*node[1])
+        if isinstance(node, tuple) and node and node[0] is _sre_parse.SUBPATTERN \
+                and (node[1][1] or node[1][2]):
+            return False
+        if isinstance(node, (list, tuple)):
+            return all(simple(x) for x in node)
+        return True
+
+    return simple(orig) and _folded_tree(orig, lambda c: ord(_fold(chr(c)))) \
+        == _folded_tree(low, lambda c: c)
+
+
+def _compile_patterns(patterns):
+    """Compile each pattern once. Where _fold_is_safe allows, a pattern is folded
+    and matched without re.IGNORECASE against text folded once per entry, which
+    spares the engine a case fold on every probe; any other pattern is compiled
+    as written with re.IGNORECASE and searched in the original text. A bad regex
+    is reported and skipped instead of crashing the first time an entry is
+    scored."""
+    out = []
+    for pat in patterns:
+        try:
+            lowered = _lower_pattern(pat)
+            if _fold_is_safe(pat, lowered):
+                out.append(re.compile(lowered))
+            else:
+                out.append(re.compile(pat, re.IGNORECASE))
+        except re.error as ex:
+            print(f"ERROR: bad pattern {pat!r}: {ex}", file=sys.stderr)
+    return out
+
+
+def _strip_leading_boundary(pat):
+    return pat[2:] if pat.startswith("\\b") else pat
+
+
+def _union(compiled):
+    """Join compiled patterns into one alternation, used as a prefilter: a single
+    C-level scan tells whether *any* pattern occurs, so the (usual) entry that
+    matches nothing skips the per-pattern loop. It can't count the hits itself,
+    since an earlier alternative shadows later ones matching at the same spot.
+    Returns None when the patterns can't be safely joined (backreferences,
+    clashing group names)."""
+    if not compiled:
+        return None
+    if any(re.search(r"\\[1-9]|\(\?P=", rx.pattern) for rx in compiled):
+        return None
+    try:
+        # Leading \b's are dropped: that only loosens the prefilter, and lets
+        # sre use its first-character scan (about 9x faster on a miss).
+        return re.compile("|".join(f"(?:{_strip_leading_boundary(rx.pattern)})"
+                                   for rx in compiled))
+    except re.error:
+        return None
+
+
+def _hs_database(compiled, ids):
+    """Compile the patterns into one Hyperscan database reporting `ids`, or return None if
+    Hyperscan isn't installed or rejects a pattern (it has no backreferences or
+    lookaround); scoring then falls back to the compiled `re` patterns."""
+    if hyperscan is None or not compiled:
+        return None
+    flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+             | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[rx.pattern.encode("utf-8") for rx in compiled],
+            ids=list(ids),
+            elements=len(compiled),
+            flags=[flags] * len(compiled),
+        )
+        return db
+    except Exception:
+        return None
+
+
+_WORD_PAT_RE = re.compile(r"\\b(\w+)\\b")  # a pattern that is just \bword\b
+
+
+def _is_word_char(ch):
+    # Exactly what sre's Unicode \w accepts.
+    return ch.isalnum() or ch == "_"
+
+
+def _at_boundary(text, i):
+    """Whether \b holds at position i of `text`."""
+    before = i > 0 and _is_word_char(text[i - 1])
+    after = i < len(text) and _is_word_char(text[i])
+    return before != after
+
+
+def _has_word(text, word):
+    """Same answer as re.search(r"\bword\b", text) for a \w+ `word`, but found
+    with C-level str.find plus a boundary check at each hit."""
+    n, end = len(word), len(text)
+    i = text.find(word)
+    while i != -1:
+        if (not (i and _is_word_char(text[i - 1]))
+                and not (i + n < end and _is_word_char(text[i + n]))):
+            return True
+        i = text.find(word, i + 1)
+    return False
+
+
+def _boundary_probe(pat):
+    """For a pattern that is a leading \b followed by the rest, return the rest
+    compiled on its own, or None. The split is checked on the parsed pattern,
+    so an alternation (\bfoo|bar), a prefix the parser factored out of one, or
+    verbose mode can't make the probe match differently."""
+    body = _strip_leading_boundary(pat)
+    if body == pat:
+        return None
+    try:
+        whole, rest = _sre_parse.parse(pat), _sre_parse.parse(body)
+    except Exception:
+        return None
+    if (whole.data[:1] != [(_sre_parse.AT, _sre_parse.AT_BOUNDARY)]
+            or repr(rest.data) != repr(whole.data[1:])
+            or rest.state.flags != whole.state.flags):
+        return None
+    return re.compile(body)
+
+
+class _PatternSet:
+    """One list of compiled patterns plus the prefilters that answer "which of
+    these occur in this text?" without running every regex. Folded patterns
+    (see _compile_patterns) go through the prefilters; the few compiled with
+    re.IGNORECASE are searched one by one in the original text."""
+
+    def __init__(self, compiled):
+        self.compiled = compiled
+        self.folded = [i for i, rx in enumerate(compiled) if not rx.flags & re.IGNORECASE]
+        self.caseless = [i for i, rx in enumerate(compiled) if rx.flags & re.IGNORECASE]
+        folded = [compiled[i] for i in self.folded]
+        self.any = _union(folded)
+        self.hs = _hs_database(folded, self.folded)
+        # Whole-word patterns (\bckm\b, \bna62\b, ...) skip the regex engine
+        # entirely; see _has_word.
+        words = [_WORD_PAT_RE.fullmatch(rx.pattern) for rx in compiled]
+        self.words = [m.group(1) if m and i in self.folded else None
+                      for i, m in enumerate(words)]
+        # A leading \b stops sre from using its literal-prefix / first-char
+        # fast scan (~30x slower per search), so such patterns are searched
+        # without it and the boundary is checked by hand at each candidate.
+        self.probes = [_boundary_probe(rx.pattern) if i in self.folded else None
+                       for i, rx in enumerate(compiled)]
+
+    def search(self, i, text, original):
+        """Equivalent of self.compiled[i].search(text), where `text` is
+        _fold(original); a re.IGNORECASE pattern searches `original` itself.
+        Offsets agree either way, since _fold keeps the length."""
+        probe = self.probes[i]
+        if probe is None:
+            rx = self.compiled[i]
+            return rx.search(original if rx.flags & re.IGNORECASE else text)
+        m = probe.search(text)
+        while m is not None and not _at_boundary(text, m.start()):
+            m = probe.search(text, m.start() + 1)
+        return m
+
+    def matching(self, text, original):
+        """Return the indices (ascending) of the patterns that occur, given
+        `text` = _fold(original): one Hyperscan pass if a database is available,
+        otherwise the union prefilter, then a plain word search for whole-word
+        patterns and a regex search for the rest."""
+        out = [i for i in self.caseless if self.compiled[i].search(original)]
+        if self.hs is not None:
+            hits = set(out)
+            self.hs.scan(text.encode("utf-8"), match_event_handler=lambda i, *_: hits.add(i))
+            return sorted(hits)
+        if self.any is not None and not self.any.search(text):
+            return out
+        for i in self.folded:
+            word = self.words[i]
+            if word is not None:
+                if _has_word(text, word):
+                    out.append(i)
+            elif self.search(i, text, original):
+                out.append(i)
+        return sorted(out) if self.caseless else out
+
+
+_KW_GROUP_OF = []
+_KW_COMPILED = []
+for _gname, _pats in KEYWORD_GROUPS.items():
+    for _rx in _compile_patterns(_pats):
+        _KW_GROUP_OF.append(_gname)
+        _KW_COMPILED.append(_rx)
+_KW = _PatternSet(_KW_COMPILED)
+_AU = _PatternSet(_compile_patterns(AUTHOR_PATTERNS))
+
 def build_url(query, start=0, max_results=100, sort_by="submittedDate", sort_order="descending"):
     params = {
         "search_query": query,
@@ -317,17 +695,61 @@ def build_url(query, start=0, max_results=100, sort_by="submittedDate", sort_ord
     return f"{ARXIV_API}?{urlencode(params)}"
 
 
+@contextlib.contextmanager
+def _urlopen(url, timeout):
+    """Open `url` and yield a readable response body. Goes through the shared
+    keep-alive session when `requests` is installed, plain urllib otherwise;
+    HTTP errors surface as urllib.error.HTTPError either way."""
+    if _SESSION is None:
+        req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            yield resp
+        return
+    r = _SESSION.get(url, timeout=timeout, stream=True)
+    try:
+        if r.status_code >= 400:
+            raise urllib.error.HTTPError(url, r.status_code, r.reason, r.headers, None)
+        r.raw.decode_content = True
+        yield r.raw
+    finally:
+        r.close()  # a fully-read body has already gone back to the pool
+
+
+class _RateLimiter:
+    """Keep calls at least `interval` seconds apart (a token bucket holding one
+    token). wait() only sleeps for whatever is left of the gap, so time spent
+    parsing the previous page counts towards it, and the first call after an
+    idle spell goes straight through. Thread-safe."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+_API_LIMITER = _RateLimiter(REQUEST_PAUSE_S)
+
+
 def _http_get(url, retries=4, base_sleep=5.0):
-    """GET with a descriptive User-Agent and exponential backoff on 429/503.
+    """GET an API URL with a descriptive User-Agent, no faster than one request
+    per REQUEST_PAUSE_S, and exponential backoff on 429/503.
 
     Returns response bytes, or raises RuntimeError('network-error:...') once all
     retries are exhausted so the caller can keep state intact and try again later.
     """
     last_err = None
     for attempt in range(retries):
-        req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+        _API_LIMITER.wait()
         try:
-            with urllib.request.urlopen(req, timeout=60) as resp:
+            with _urlopen(url, timeout=60) as resp:
                 return resp.read()
         except urllib.error.HTTPError as e:
             last_err = e
@@ -350,16 +772,41 @@ def _http_get(url, retries=4, base_sleep=5.0):
     raise RuntimeError(f"network-error:{last_err}")
 
 
-def fetch_entries_paged(query, since_iso=None, max_per_page=100, max_pages=100):
+# Fully-qualified Atom tags. A plain "{ns}tag" lets find/findall scan the
+# children directly instead of going through ElementPath with a prefix map.
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_A_ENTRY = _ATOM + "entry"
+_A_ID = _ATOM + "id"
+_A_UPDATED = _ATOM + "updated"
+_A_PUBLISHED = _ATOM + "published"
+_A_TITLE = _ATOM + "title"
+_A_SUMMARY = _ATOM + "summary"
+_A_LINK = _ATOM + "link"
+_A_CATEGORY = _ATOM + "category"
+_A_AUTHOR = _ATOM + "author"
+_A_NAME = _ATOM + "name"
+
+
+def _iter_entries(data, *tags):
+    """Stream-parse one feed page, yielding each element with one of `tags` as
+    soon as it is complete and clearing it once the caller resumes, so the page's
+    DOM is never built in full and an early stop skips parsing the rest."""
+    for _, elem in ET.iterparse(io.BytesIO(data)):
+        if elem.tag in tags:
+            yield elem
+            elem.clear()
+
+
+def fetch_entries_paged(query, since_iso=None, max_per_page=100, max_pages=100, keep=None):
     """
     Generator over entries, newest first. If since_iso is provided, we sort by lastUpdatedDate
     and can early-stop once entries are older than the cutoff. Otherwise we sort by submittedDate.
+    If `keep` is given it is called with a minimal {"id", "link", "updated"} dict; entries it
+    rejects are dropped before their text, links, categories and authors are extracted.
     """
     start = 0
     page = 0
-    cutoff = None
-    if since_iso:
-        cutoff = dt.datetime.fromisoformat(since_iso.replace("Z", "+00:00"))
+    cutoff = _parse_iso(since_iso)
 
     # --- IMPORTANT FIX: use lastUpdatedDate when since_iso is set ---
     sort_key = "lastUpdatedDate" if since_iso else "submittedDate"
@@ -367,90 +814,225 @@ def fetch_entries_paged(query, since_iso=None, max_per_page=100, max_pages=100):
     while page < max_pages:
         url = build_url(query, start=start, max_results=max_per_page,
                         sort_by=sort_key, sort_order="descending")
-        if page > 0:
-            time.sleep(REQUEST_PAUSE_S)  # be polite between paged requests
         data = _http_get(url)  # raises RuntimeError('network-error:...') on failure
-        root = ET.fromstring(data)
-        ns = {"a": "http://www.w3.org/2005/Atom"}
-        es = root.findall("a:entry", ns)
-        if not es:
-            break
+        n_entries = 0
 
-        for e in es:
-            def g(tag):
-                x = e.find(f"a:{tag}", ns)
-                return x.text if x is not None else ""
-            title   = (g("title") or "").strip().replace("\n", " ")
-            summary = (g("summary") or "").strip()
-            link    = (g("id") or "").strip()
-            updated = g("updated") or g("published")
+        for e in _iter_entries(data, _A_ENTRY):
+            n_entries += 1
+            link    = (e.findtext(_A_ID) or "").strip()
+            updated = e.findtext(_A_UPDATED) or e.findtext(_A_PUBLISHED) or ""
+            updated_dt = _parse_iso(updated)  # parsed once; filters downstream reuse it
 
             # --- IMPORTANT FIX: only early-stop when sorting by lastUpdatedDate ---
             if cutoff and sort_key == "lastUpdatedDate":
-                try:
-                    t = dt.datetime.fromisoformat(updated.replace("Z", "+00:00"))
-                    if t < cutoff:
-                        return  # safe to stop; feed is descending by updated time
-                except Exception:
-                    pass
-
-            pdf_url = None
-            for l in e.findall("a:link", ns):
-                if l.attrib.get("type", "").endswith("pdf"):
-                    pdf_url = l.attrib.get("href")
-            cats = [c.attrib.get("term", "") for c in e.findall("a:category", ns)]
-            authors = []
-            for a in e.findall("a:author", ns):
-                n = a.find("a:name", ns)
-                if n is not None and n.text:
-                    authors.append(n.text.strip())
-            yield {
-                "title": title,
-                "summary": summary,
+                if updated_dt is not None and updated_dt < cutoff:
+                    return  # safe to stop; feed is descending by updated time
+
+            entry = {
+                "id": link.removesuffix("/").rpartition("/")[2],
                 "link": link,
-                "pdf": pdf_url,
                 "updated": updated,
-                "categories": cats,
-                "authors": authors,
+                "updated_dt": updated_dt,
             }
+            if keep is not None and not keep(entry):
+                continue
+
+            # Survivors only: the rest of the entry (author lists can be long).
+            entry["title"] = (e.findtext(_A_TITLE) or "").strip().replace("\n", " ")
+            entry["summary"] = (e.findtext(_A_SUMMARY) or "").strip()
+            entry["pdf"] = next((l.attrib.get("href") for l in e.iterfind(_A_LINK)
+                                 if l.attrib.get("type", "").endswith("pdf")), None)
+            entry["categories"] = [c.attrib.get("term", "") for c in e.findall(_A_CATEGORY)]
+            authors = []
+            for a in e.findall(_A_AUTHOR):
+                n = a.findtext(_A_NAME)
+                if n:
+                    authors.append(n.strip())
+            entry["authors"] = authors
+            yield entry
+        if not n_entries:
+            break
         start += max_per_page
         page += 1
 
 
-def within_hours(iso_ts, hours):
-    if not iso_ts:
-        return True
-    try:
-        t = dt.datetime.fromisoformat(iso_ts.replace("Z", "+00:00"))
-    except Exception:
-        return True
-    return (_now_utc() - t).total_seconds() <= hours * 3600
+_OAI = "{http://www.openarchives.org/OAI/2.0/}"
+_OAI_RECORD = _OAI + "record"
+_OAI_HEADER = _OAI + "header"
+_OAI_METADATA = _OAI + "metadata"
+_OAI_TOKEN = _OAI + "resumptionToken"
+_OAI_ERROR = _OAI + "error"
+_RAW = "{http://arxiv.org/OAI/arXivRaw/}"
+_RAW_ROOT = _RAW + "arXivRaw"
+_RAW_ID = _RAW + "id"
+_RAW_VERSION = _RAW + "version"
+_RAW_DATE = _RAW + "date"
+_RAW_TITLE = _RAW + "title"
+_RAW_ABSTRACT = _RAW + "abstract"
+_RAW_AUTHORS = _RAW + "authors"
+_RAW_CATEGORIES = _RAW + "categories"
+
+# Archives whose OAI set lives under the "physics" group (physics:hep-ex, ...);
+# the others are sets of their own (cs, math, stat, ...).
+_OAI_PHYSICS_ARCHIVES = {
+    "astro-ph", "cond-mat", "gr-qc", "hep-ex", "hep-lat", "hep-ph", "hep-th",
+    "math-ph", "nlin", "nucl-ex", "nucl-th", "physics", "quant-ph",
+}
+_CLAUSE_RE = re.compile(r'(all|ti|abs|au|cat):("[^"]+"|\S+)')
+
+
+def _oai_set(cat):
+    archive = cat.split(".")[0]
+    return f"physics:{archive}" if archive in _OAI_PHYSICS_ARCHIVES else archive
+
+
+def _query_filter(terms):
+    """OAI-PMH has no search, so approximate the API's OR-ed ``all:``/``ti:``/
+    ``abs:``/``au:``/``cat:`` clauses client-side: a term or quoted phrase must
+    occur as whole words (case-insensitive) in that field, a category must be
+    listed on the paper. Returns a predicate over a full entry dict; clauses it
+    can't read are reported and left out."""
+    cats = set()
+    by_field = {}
+    for t in terms:
+        m = _CLAUSE_RE.fullmatch(t.strip())
+        if not m:
+            print(f"WARNING: --oai can't apply query clause {t!r}; ignoring it", file=sys.stderr)
+            continue
+        field, value = m.group(1), m.group(2).strip('"')
+        if field == "cat":
+            cats.add(value)
+            continue
+        words = re.sub(r"^\W+|\W+$", "", value).split()  # "|V_us|" searches as V_us
+        if words:
+            by_field.setdefault(field, []).append(r"\s+".join(map(re.escape, words)))
+    rxs = [(field, re.compile(r"(?<!\w)(?:" + "|".join(pats) + r")(?!\w)", re.IGNORECASE))
+           for field, pats in by_field.items()]
+
+    def matches(e):
+        if cats.intersection(e["categories"]):
+            return True
+        authors = " ; ".join(e["authors"])
+        text = {
+            "ti": e["title"], "abs": e["summary"], "au": authors,
+            "all": f'{e["title"]}\n{e["summary"]}\n{authors}',
+        }
+        return any(rx.search(text[field]) for field, rx in rxs)
+    return matches
+
+
+def _split_authors(s):
+    # arXivRaw keeps the submitter's "A. One, B. Two (Inst.) and C. Three" string.
+    # Drop affiliations innermost first, so nested ones like "(Inst. X (Y))" go too.
+    prev = None
+    while prev != s:
+        prev, s = s, re.sub(r"\([^()]*\)", "", s)
+    s = " ".join(s.split())
+    return [a.strip() for a in re.split(r",\s*(?:and\s+)?|\s+and\s+", s) if a.strip()]
+
+
+def fetch_entries_oai(categories, terms, from_date, since_iso=None, keep=None):
+    """
+    Generator over the papers in `categories` whose OAI datestamp (last change,
+    so never before their newest version) is on or after `from_date`
+    (YYYY-MM-DD), harvested through arXiv's OAI-PMH interface. Unlike paging
+    the search API, resumption tokens walk the full result set, so long
+    backfills don't go missing past the API's first few thousand results.
+
+    Records come oldest change first, in arXivRaw format so IDs carry their
+    version like the API's. Entries are shaped like fetch_entries_paged's and
+    `keep` is applied the same way; the search clauses in `terms` and the
+    `categories` are then checked client-side (see _query_filter). Entries last
+    updated before `since_iso` are dropped. No OAI "until" is sent: a paper
+    whose metadata changed later (a journal-ref, say) would fall outside it.
+    """
+    cats = set(categories)
+    matches = _query_filter(terms)
+    cutoff = _parse_iso(since_iso)
+    for spec in dict.fromkeys(map(_oai_set, categories)):
+        params = {"verb": "ListRecords", "metadataPrefix": "arXivRaw",
+                  "set": spec, "from": from_date}
+        while params:
+            data = _http_get(f"{OAI_URL}?{urlencode(params)}")
+            params = None
+            for el in _iter_entries(data, _OAI_RECORD, _OAI_TOKEN, _OAI_ERROR):
+                if el.tag == _OAI_TOKEN:
+                    token = (el.text or "").strip()  # empty on the last page
+                    if token:
+                        params = {"verb": "ListRecords", "resumptionToken": token}
+                    continue
+                if el.tag == _OAI_ERROR:
+                    code = el.get("code")
+                    if code == "noRecordsMatch":
+                        break
+                    raise RuntimeError(f"network-error:OAI-PMH {code}: {(el.text or '').strip()}")
+
+                header = el.find(_OAI_HEADER)
+                meta = el.find(_OAI_METADATA)
+                raw = meta.find(_RAW_ROOT) if meta is not None else None
+                if raw is None or (header is not None and header.get("status") == "deleted"):
+                    continue
+                versions = raw.findall(_RAW_VERSION)
+                if not versions:
+                    continue
+                latest = versions[-1]
+                try:
+                    updated_dt = parsedate_to_datetime(latest.findtext(_RAW_DATE, ""))
+                except (TypeError, ValueError):
+                    updated_dt = None
+                if cutoff and updated_dt is not None and updated_dt < cutoff:
+                    continue
+                vid = (raw.findtext(_RAW_ID) or "").strip() + latest.get("version", "")
+                link = f"http://arxiv.org/abs/{vid}"
+                entry = {
+                    "id": vid.rpartition("/")[2],  # hep-ph/0703001v1 -> 0703001v1, as above
+                    "link": link,
+                    "updated": f"{updated_dt:%Y-%m-%dT%H:%M:%SZ}" if updated_dt else "",
+                    "updated_dt": updated_dt,
+                }
+                if keep is not None and not keep(entry):
+                    continue
+
+                entry["categories"] = (raw.findtext(_RAW_CATEGORIES) or "").split()
+                if not cats.intersection(entry["categories"]):
+                    continue
+                entry["title"] = (raw.findtext(_RAW_TITLE) or "").strip().replace("\n", " ")
+                entry["summary"] = (raw.findtext(_RAW_ABSTRACT) or "").strip()
+                entry["authors"] = _split_authors(raw.findtext(_RAW_AUTHORS) or "")
+                if not matches(entry):
+                    continue
+                entry["pdf"] = f"http://arxiv.org/pdf/{vid}"
+                yield entry
 
 
 def keyword_score(text):
-    """Return (score, matched_groups). Each matching pattern adds 1 (unchanged
-    scoring); matched_groups names which topic groups fired, for labelling."""
+    """Return (score, matched_groups) for `text` (title and abstract). Each matching pattern adds 1 (unchanged scoring); matched_groups names which
+    topic groups fired, for labelling. Deliberately uncapped: the full count
+    ranks the hits and is what the CSV, reports and labels show."""
+    text_lc = _fold(text)
     score = 0
     matched = []
-    for gname, pats in KEYWORD_GROUPS.items():
-        for pat in pats:
-            if re.search(pat, text, flags=re.IGNORECASE):
-                score += 1
-                if gname not in matched:
-                    matched.append(gname)
+    for i in _KW.matching(text_lc, text):
+        score += 1
+        gname = _KW_GROUP_OF[i]
+        if gname not in matched:
+            matched.append(gname)
     return score, matched
 
 
-def author_score(authors_list):
-    """Return (score, matched_authors). Author hits are weighted x2."""
-    txt = " ; ".join(authors_list)
+def author_score(txt):
+    """Return (score, matched_authors) for the " ; "-joined author list `txt`.
+    Author hits are weighted x2."""
+    txt_lc = _fold(txt)
     score = 0
     matched = []
-    for pat in AUTHOR_PATTERNS:
-        m = re.search(pat, txt, flags=re.IGNORECASE)
+    for i in _AU.matching(txt_lc, txt):
+        # Re-run the one matching pattern to get the name text for the label;
+        # _fold keeps offsets, so the span cuts the original-case name.
+        m = _AU.search(i, txt_lc, txt)
         if m:
             score += 2  # heavier weight for author hits
-            matched.append(m.group(0))
+            matched.append(txt[m.start():m.end()])
     return score, matched
 
 
@@ -459,9 +1041,11 @@ def _osa_escape(s):
     return (s or "").replace("\\", "\\\\").replace('"', '\\"')
 
 
+@functools.lru_cache(maxsize=None)
 def _find_terminal_notifier():
     """Locate terminal-notifier. shutil.which alone fails under launchd because
-    its PATH usually omits Homebrew, so check the common absolute locations too."""
+    its PATH usually omits Homebrew, so check the common absolute locations too.
+    Cached: a run with many hits would otherwise search PATH once per alert."""
     p = shutil.which("terminal-notifier")
     if p:
         return p
@@ -548,17 +1132,34 @@ def write_html_report(path, hits, scope_str):
     return str(path)
 
 
+_FNAME_RE = re.compile(r'[^A-Za-z0-9_.-]+')
+
+
 def download_pdf(url, out_dir, nice_name):
     if not url:
         return None
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
     # sanitize filename
-    safe = re.sub(r'[^A-Za-z0-9_.-]+', '_', nice_name)[:180]
+    safe = _FNAME_RE.sub('_', nice_name)[:180]
     path = out_dir / (safe + ".pdf")
+    # The name starts with the versioned arXiv ID (e.g. 2401.01234v2) and a
+    # version's PDF never changes, so one saved by an earlier run is still good.
+    if path.is_file() and path.stat().st_size > 0:
+        return str(path)
     try:
-        with urllib.request.urlopen(url) as resp, open(path, "wb") as f:
-            f.write(resp.read())
+        # Write to a .part file and rename it into place when complete, so even a
+        # killed run never leaves a truncated PDF under the final name.
+        part = path.with_name(path.name + ".part")
+        with _urlopen(url, timeout=30) as resp:
+            try:
+                # stream in 1 MiB chunks rather than holding the whole PDF in memory
+                with open(part, "wb") as f:
+                    shutil.copyfileobj(resp, f, length=1 << 20)
+                part.replace(path)
+            except Exception:
+                part.unlink(missing_ok=True)
+                raise
         return str(path)
     except Exception:
         return None
@@ -574,6 +1175,9 @@ def main():
                    help="All of a calendar year, e.g. --year 2026 (Jan 1 → Dec 31).")
     p.add_argument("--until", type=str, default=None,
                    help="End date YYYY-MM-DD for a catch-up range (use with --since).")
+    p.add_argument("--oai", action="store_true",
+                   help="Harvest through arXiv's OAI-PMH interface instead of the search API "
+                        "(for long --since/--year backfills).")
     p.add_argument("--no-dedupe", action="store_true",
                    help="Show all matches in the window (don't skip already-seen papers, "
                         "and don't touch the watch state). Use for on-demand digests.")
@@ -588,6 +1192,8 @@ def main():
     p.add_argument("--notify", action="store_true", help="Show a macOS notification for each hit.")
     p.add_argument("--csv", type=str, default=str(Path.home() / "Papers" / "arxiv_hits" / "hits_log.csv"))
     p.add_argument("--dry", action="store_true", help="Do not download PDFs.")
+    p.add_argument("--pdf-workers", type=int, default=PDF_WORKERS,
+                   help=f"Concurrent PDF downloads (default {PDF_WORKERS}; keep it small to be polite to arxiv.org).")
         # --- plist builder/installer flags ---
     p.add_argument("--build-plist", action="store_true",
                    help="Build a LaunchAgent plist next to the current working dir.")
@@ -627,6 +1233,12 @@ def main():
     p.add_argument("--open", dest="open_report", action="store_true",
                help="Open an HTML digest in your browser when done (implies --html).")
     args = p.parse_args()
+    args.pdf_workers = max(1, args.pdf_workers)
+    if _SESSION is not None:
+        # requests keeps at most 10 idle connections per host and drops the
+        # rest after use; size the pool so each PDF worker keeps its own.
+        for prefix in ("http://", "https://"):
+            _SESSION.mount(prefix, requests.adapters.HTTPAdapter(pool_maxsize=args.pdf_workers))
 
     # --- friendly time-window normalisation ---
     if args.days is not None:
@@ -635,6 +1247,9 @@ def main():
         args.since = f"{args.year:04d}-01-01"
         if not args.until:
             args.until = f"{args.year:04d}-12-31"
+    # OAI has no page cap: without a start it would harvest the whole archive.
+    if args.oai and args.until and not args.since and args.hours is None:
+        p.error("--oai with --until needs a start date: add --since (or use --year)")
         # If user is building/ installing plist, do that first and exit.
     if args.build_plist or args.install_plist:
         plist_path = build_plist(
@@ -655,6 +1270,8 @@ def main():
             print("Tip: run `launchctl kickstart -k gui/$(id -u)/{}` to trigger a run now.".format(args.label))
         return
     state = _load_state()
+    seen_ids_list, rewrite_seen = _load_seen_ids(state)
+    now = _now_utc()  # one clock read per run; every cutoff below is relative to it
 
     auto_mode = args.hours is None and not args.since and not args.until
     dynamic_hours = None
@@ -663,7 +1280,7 @@ def main():
         # Cheap no-op: if we already succeeded recently, don't hit the API again.
         # This is what makes the hourly launchd wake-ups harmless and dodges 429s.
         if last is not None and not args.force:
-            since_last_h = (_now_utc() - last).total_seconds() / 3600.0
+            since_last_h = (now - last).total_seconds() / 3600.0
             if since_last_h < args.every_hours:
                 print(f"Skipping: last successful run {since_last_h:.1f}h ago "
                       f"(< --every-hours {args.every_hours}). Use --force to override.")
@@ -674,7 +1291,7 @@ def main():
         if last is None:
             dynamic_hours = 24
         else:
-            delta_h = (_now_utc() - last).total_seconds() / 3600.0
+            delta_h = (now - last).total_seconds() / 3600.0
             dynamic_hours = max(23, min(24 * 14, int(round(delta_h)) + 1))
         # behave as if user supplied --hours
         args.hours = dynamic_hours
@@ -683,49 +1300,69 @@ def main():
     if args.since:
         # Interpret as 00:00 at the given date; stored as UTC-style ISO string.
         since_iso = f"{args.since}T00:00:00+00:00"
+    hours_cutoff = None
+    if args.hours is not None:
+        hours_cutoff = now - dt.timedelta(hours=args.hours)
     until_dt = None
     if args.until:
         # Inclusive end-of-day for the given date.
         until_dt = dt.datetime.fromisoformat(f"{args.until}T23:59:59+00:00")
 
-    query = build_query(EXTRA_QUERY)
+    start_dt = dt.datetime.fromisoformat(since_iso) if since_iso else hours_cutoff
+    query = build_query(EXTRA_QUERY, start=start_dt, end=until_dt)
     seen_ids_run = set()
+    scored_ids = set()  # every ID scored this run, hit or not
     hits = []
+    seen_ids_state = set(seen_ids_list)
+
+    def wanted(e):
+        # Cheap checks on ID + timestamp, run before the rest of the entry is
+        # even extracted from the feed.
+        t = e["updated_dt"]  # None (unknown) is kept, as before
+        if hours_cutoff is not None and t is not None and t < hours_cutoff:
+            return False
+        # date-range catch-up: drop anything newer than --until
+        if until_dt is not None and t is not None and t > until_dt:
+            return False
+        # skip duplicates *before* any regex work; pages can overlap, so also
+        # skip IDs already scored this run (not just hits)
+        arxiv_id = e["id"]
+        if not arxiv_id or arxiv_id in scored_ids:
+            return False
+        if not args.no_dedupe and arxiv_id in seen_ids_state:
+            return False
+        return True
+
     try:
-        entries_iter = fetch_entries_paged(
-            query,
-            since_iso=since_iso if args.since else None,
-            max_per_page=args.max,
-            max_pages=500 if args.since else 6
-        )
-        seen_ids_state = set(state.get("seen_ids", []))
+        if args.oai:
+            entries_iter = fetch_entries_oai(
+                sorted(_HEP_CATS),
+                list(CORE_TERMS) + list(EXTRA_QUERY),
+                from_date=f"{start_dt:%Y-%m-%d}",
+                since_iso=since_iso,
+                keep=wanted,
+            )
+        else:
+            entries_iter = fetch_entries_paged(
+                query,
+                since_iso=since_iso if args.since else None,
+                max_per_page=args.max,
+                max_pages=500 if args.since else 6,
+                keep=wanted,
+            )
         for e in entries_iter:
-            if args.hours is not None:
-                if not within_hours(e.get("updated", ""), args.hours):
-                    continue
-            # date-range catch-up: drop anything newer than --until
-            if until_dt is not None:
-                try:
-                    t = dt.datetime.fromisoformat(e.get("updated", "").replace("Z", "+00:00"))
-                    if t > until_dt:
-                        continue
-                except Exception:
-                    pass
-            # derive arXiv ID and skip duplicates
-            arxiv_id = (e.get("link", "").rstrip("/").split("/")[-1]) or None
-            if not arxiv_id:
-                continue
-            if arxiv_id in seen_ids_run:
-                continue
-            if not args.no_dedupe and arxiv_id in seen_ids_state:
+            arxiv_id = e["id"]
+            scored_ids.add(arxiv_id)
+            # Safety net: the query already restricts categories, so this only
+            # skips scoring if a feed ever returns something outside them.
+            if _HEP_CATS.isdisjoint(e["categories"]):
                 continue
 
-            text = (e.get("title", "") + "\n" + e.get("summary", ""))
-            kscore, kgroups = keyword_score(text)
-            ascore, amatched = author_score(e.get("authors", []))
+            kscore, kgroups = keyword_score(e.get("title", "") + "\n" + e.get("summary", ""))
+            ascore, amatched = author_score(" ; ".join(e["authors"]))
             score = kscore + ascore
-            labels = list(kgroups) + [f"@{a}" for a in amatched]
             if score >= args.min_score:
+                labels = kgroups + [f"@{a}" for a in amatched]
                 hits.append((score, e, kscore, ascore, arxiv_id, labels))
                 seen_ids_run.add(arxiv_id)
     except RuntimeError as ex:
@@ -737,38 +1374,51 @@ def main():
     else:
         network_failed = False
 
-    # Sort primarily by total score (desc). The API feed is already newest-first.
-    hits.sort(key=lambda x: (-x[0],))
+    # Sort primarily by total score (desc). The API feed is already newest-first,
+    # and the sort is stable (also with reverse=True), so ties keep that order.
+    if args.oai:  # OAI lists oldest change first, and set by set
+        hits.sort(key=lambda h: h[1]["updated"], reverse=True)
+    hits.sort(key=operator.itemgetter(0), reverse=True)
 
     # --- Full log (kept as-is) ---
     csv_path_full = Path(args.csv).expanduser().resolve()
     csv_path_full.parent.mkdir(parents=True, exist_ok=True)
     new_file_full = not csv_path_full.exists()
-    
-    with open(csv_path_full, "a", newline="") as f:
+
+    # PDF downloads are pure network waits: overlap them instead of fetching
+    # one after another inside the CSV loop. map() keeps results in hit order.
+    saved_pdfs = [None] * len(hits)
+    if not args.dry and hits:
+        jobs = [(e.get("pdf"), args.out, f'{arxiv_id}_{e.get("title", "")[:80]}')
+                for score, e, kscore, ascore, arxiv_id, labels in hits]
+        with ThreadPoolExecutor(max_workers=args.pdf_workers) as ex:
+            saved_pdfs = list(ex.map(lambda job: download_pdf(*job), jobs))
+
+    with open(csv_path_full, "a", newline="", buffering=1 << 16) as f:
         w = csv.writer(f)
         if new_file_full:
             w.writerow([
                 "timestamp", "score_total", "score_keywords", "score_authors",
                 "groups", "title", "link", "pdf_saved_or_url", "updated", "categories", "authors"
             ])
-        for score, e, kscore, ascore, arxiv_id, labels in hits:
-            saved_pdf = None
-            if not args.dry:
-                base_name = f'{arxiv_id}_{e.get("title", "")[:80]}'
-                saved_pdf = download_pdf(e.get("pdf"), args.out, base_name)
-            # shorten author list here
-            authors_short = format_authors(e.get("authors", []), max_authors=3)
-            w.writerow([
-                dt.datetime.now().isoformat(), score, kscore, ascore, ";".join(labels),
+        run_ts = dt.datetime.now().isoformat()  # one timestamp for the whole batch
+        w.writerows([  # one batched write for the whole run
+            [
+                run_ts, score, kscore, ascore, ";".join(labels),
                 e.get("title", ""), e.get("link", ""), saved_pdf or e.get("pdf", ""),
-                e.get("updated", ""), ";".join(e.get("categories", [])), authors_short
-            ])
-            if args.notify:
-                label_str = ", ".join(labels) if labels else f"kw{kscore}+au{ascore}"
-                subtitle = f"score {score} · {label_str}"
-                message = f"[{arxiv_id}] {e.get('title', '')}"
-                notify_macos("arXiv hit", subtitle, message, url=e.get("link"))
+                e.get("updated", ""), ";".join(e.get("categories", [])),
+                format_authors(e.get("authors", []), max_authors=3),  # shortened list
+            ]
+            for (score, e, kscore, ascore, arxiv_id, labels), saved_pdf in zip(hits, saved_pdfs)
+        ])
+
+    # Notify only once the log is safely written: each one spawns a process.
+    if args.notify:
+        for score, e, kscore, ascore, arxiv_id, labels in hits:
+            label_str = ", ".join(labels) if labels else f"kw{kscore}+au{ascore}"
+            subtitle = f"score {score} · {label_str}"
+            message = f"[{arxiv_id}] {e.get('title', '')}"
+            notify_macos("arXiv hit", subtitle, message, url=e.get("link"))
 
     # Print concise report
     # --- Pretty console report (replace your old print block with this) ---
@@ -856,11 +1506,11 @@ def main():
     if args.no_dedupe:
         return
 
-    # Persist dedupe IDs always; only advance last_success on full success
-    merged = list(dict.fromkeys(state.get("seen_ids", []) + list(seen_ids_run)))
-    if len(merged) > 5000:
-        merged = merged[-5000:]
-    state["seen_ids"] = merged
+    # Persist dedupe IDs always (only the new ones are appended); only advance
+    # last_success on full success. Every ID in seen_ids_run was unseen.
+    _save_seen_ids(seen_ids_list, sorted(seen_ids_run), rewrite=rewrite_seen)
+    if rewrite_seen is not None:  # else the old list isn't in the log yet
+        state.pop("seen_ids", None)
 
     if not network_failed:
         state["last_success_iso"] = _now_utc().isoformat()